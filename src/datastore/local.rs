@@ -1,7 +1,7 @@
 use std::collections::HashMap;
 use std::fs;
 use std::fs::File;
-use std::io::{self, BufRead};
+use std::io::{self, BufRead, Read, Seek, SeekFrom, Write};
 use std::path::{Path, PathBuf};
 
 use super::DataStore;
@@ -18,14 +18,12 @@ impl LocalDataStore {
             .clone()
             .unwrap_or_else(|| String::from(default_path.clone()));
 
-        if !Path::new(&data).is_dir() {
-            match fs::create_dir(&data) {
-                Ok(_file) => {
-                    log::info!("==> creating directory {}", &data)
-                }
-                Err(error) => {
-                    panic!("cannot create directory; {}, error: {:?}", &data, error);
-                }
+        match fs::create_dir_all(&data) {
+            Ok(_) => {
+                log::debug!("==> ensured directory {}", &data)
+            }
+            Err(error) => {
+                panic!("cannot create directory; {}, error: {:?}", &data, error);
             }
         }
 
@@ -48,22 +46,70 @@ impl DataStore for LocalDataStore {
         let lines = io::BufReader::new(file).lines();
 
         lines
-            .map(|line| {
+            .filter_map(|line| {
                 let data = line.unwrap();
-                let obj: Link = serde_json::from_str(&data).unwrap();
-                (obj.url.clone(), obj)
+                if data.trim().is_empty() {
+                    return None;
+                }
+                match serde_json::from_str::<Link>(&data) {
+                    Ok(obj) => Some((obj.url.clone(), obj)),
+                    Err(error) => {
+                        log::warn!("==> skipping malformed link line, error: {:?}", error);
+                        None
+                    }
+                }
             })
             .collect()
     }
 
     fn set_links(&mut self, links: &HashMap<String, Link>) {
         let filename = Path::new(&self.path).join("links.jsonl");
+        let tmp_filename = Path::new(&self.path).join("links.jsonl.tmp");
+
+        let file = File::create(&tmp_filename).expect("failed to open links file");
+        let mut writer = io::BufWriter::new(file);
+
+        for obj in links.values() {
+            serde_json::to_writer(&mut writer, obj).expect("failed to serialize link");
+            writer.write_all(b"\n").expect("failed to write to file");
+        }
+
+        writer.flush().expect("failed to write to file");
+
+        fs::rename(tmp_filename, filename).expect("failed to replace links file");
+    }
+
+    fn append_link(&mut self, link: &Link) {
+        let filename = Path::new(&self.path).join("links.jsonl");
+
+        let mut file = fs::OpenOptions::new()
+            .read(true)
+            .append(true)
+            .open(filename)
+            .expect("failed to open links file");
 
-        let updated_links: Vec<String> = links
-            .values()
-            .map(|obj| serde_json::to_string(obj).unwrap())
-            .collect();
+        // Files written before set_links newline-terminated its output end
+        // mid-line; appending straight onto them would merge the new record
+        // with the old last one. Check the last byte and repair if needed.
+        let size = file.metadata().expect("failed to stat links file").len();
+        let needs_newline = if size > 0 {
+            let mut last_byte = [0u8; 1];
+            file.seek(SeekFrom::End(-1))
+                .expect("failed to seek links file");
+            file.read_exact(&mut last_byte)
+                .expect("failed to read links file");
+            last_byte[0] != b'\n'
+        } else {
+            false
+        };
 
-        std::fs::write(filename, updated_links.join("\n")).expect("failed to write to file");
+        let mut writer = io::BufWriter::new(file);
+
+        if needs_newline {
+            writer.write_all(b"\n").expect("failed to write to file");
+        }
+        serde_json::to_writer(&mut writer, link).expect("failed to serialize link");
+        writer.write_all(b"\n").expect("failed to write to file");
+        writer.flush().expect("failed to write to file");
     }
 }
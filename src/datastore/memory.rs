@@ -22,4 +22,8 @@ impl DataStore for MemoryDataStore {
     fn set_links(&mut self, links: &HashMap<String, Link>) {
         self.links = links.clone()
     }
+
+    fn append_link(&mut self, link: &Link) {
+        self.links.insert(link.url.clone(), link.clone());
+    }
 }
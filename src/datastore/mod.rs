@@ -7,4 +7,5 @@ use std::collections::HashMap;
 pub trait DataStore {
     fn get_links(&self) -> HashMap<String, Link>;
     fn set_links(&mut self, links: &HashMap<String, Link>);
+    fn append_link(&mut self, link: &Link);
 }
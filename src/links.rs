@@ -7,6 +7,7 @@ use crate::datastore::DataStore;
 use crate::types::Link;
 use serde_json::json;
 use std::collections::{HashMap, HashSet};
+use std::io::{self, Write};
 
 impl Link {
     fn new(url: &String, description: String, tags: String) -> Link {
@@ -24,6 +25,8 @@ impl Link {
 
 #[derive(Clone, Default)]
 struct TagCompleter {
+    // Tags must be lowercased already (see get_tags_from_links) so that
+    // suggestions can be matched without re-lowercasing per keystroke.
     tags: Vec<String>,
     input: String,
 }
@@ -46,8 +49,8 @@ impl Autocomplete for TagCompleter {
         Ok(self
             .tags
             .iter()
-            .filter(|s| s.to_lowercase().contains(&current_tag))
-            .map(|s| String::from(s.clone()))
+            .filter(|s| s.contains(current_tag))
+            .cloned()
             .collect())
     }
 
@@ -74,7 +77,7 @@ fn read_link_data_from_prompt(
     url: &String,
     tags: Vec<String>,
     description: Option<String>,
-    all_tags: &Vec<String>,
+    links: &HashMap<String, Link>,
 ) -> Link {
     let link_description = if description.is_some() {
         description.unwrap()
@@ -85,10 +88,12 @@ fn read_link_data_from_prompt(
     let link_tags = if tags.len() > 0 {
         tags.join(",")
     } else {
+        let all_tags = get_tags_from_links(links);
+
         Text::new("Tags (t1,t2,t3):")
             .with_autocomplete(TagCompleter {
                 input: String::from(""),
-                tags: all_tags.clone(),
+                tags: all_tags,
             })
             .prompt()
             .unwrap()
@@ -102,9 +107,8 @@ fn read_link_data_from_prompt(
 fn get_tags_from_links(links: &HashMap<String, Link>) -> Vec<String> {
     let tags: HashSet<_> = links
         .values()
-        .into_iter()
-        .flat_map(|link| link.tags.clone())
-        .map(|tag| String::from(tag.to_lowercase().trim()))
+        .flat_map(|link| link.tags.iter())
+        .map(|tag| tag.trim().to_lowercase())
         .collect();
 
     tags.into_iter().collect::<Vec<String>>()
@@ -116,17 +120,14 @@ pub fn add_link<T: DataStore>(
     tags: Vec<String>,
     description: Option<String>,
 ) -> Link {
-    let mut links = datastore.get_links();
-    let all_tags = get_tags_from_links(&links);
+    let links = datastore.get_links();
 
     if !links.contains_key(&url) {
-        let link = read_link_data_from_prompt(&url, tags, description, &all_tags);
+        let link = read_link_data_from_prompt(&url, tags, description, &links);
 
         log::info!("==> Added link {:#}", json!(link.clone()));
 
-        links.insert(link.url.clone(), link.clone());
-
-        datastore.set_links(&links);
+        datastore.append_link(&link);
 
         link
     } else {
@@ -138,7 +139,13 @@ pub fn add_link<T: DataStore>(
 
 pub fn list_links<T: DataStore>(datastore: &mut T) {
     let links = datastore.get_links();
+
+    let stdout = io::stdout();
+    let mut out = io::BufWriter::new(stdout.lock());
+
     for (link, obj) in links {
-        println!("{:?} - {:?}", link, obj.clone())
+        writeln!(out, "{:?} - {:?}", link, obj).expect("failed to write to stdout");
     }
+
+    out.flush().expect("failed to write to stdout");
 }
@@ -57,20 +57,22 @@ fn main() {
 
     log::debug!("==> cli arguments: {:?}", args);
 
-    let mut datastore = LocalDataStore::new(args.data);
-
-    log::debug!("==> data directory: {:?}", datastore.path);
-
     match args.command {
         None => {
             log::info!("==> no command");
         }
-        Some(command) => match command {
-            Commands::Link {
-                add,
-                tag,
-                description,
-            } => handle_link(&mut datastore, add, tag, description),
-        },
+        Some(command) => {
+            let mut datastore = LocalDataStore::new(args.data);
+
+            log::debug!("==> data directory: {:?}", datastore.path);
+
+            match command {
+                Commands::Link {
+                    add,
+                    tag,
+                    description,
+                } => handle_link(&mut datastore, add, tag, description),
+            }
+        }
     }
 }